@@ -2,20 +2,16 @@
 # OLED系统监控显示器 - SSD1306专用
 
 import time
-import datetime
 import socket
-import psutil
+import fcntl
+import struct
 import os
 import argparse
-import configparser
-import glob
 import signal
 import logging
-from luma.core.interface.serial import i2c
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
-from PIL import ImageFont
+import string
 
+# luma/PIL在参数解析之后才按需导入，--help无需加载这些库
 # ===== 日志配置 =====
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +28,7 @@ DEFAULT_CONFIG = {
     'i2c_port': 6,
     'i2c_address': 0x3C,
     'refresh_interval': 1,
+    'sample_interval': 2,     # CPU温度/频率采样间隔(秒)
     'network_interface': 'eth0',
     'font_path': 'NotoMono-Regular.ttf',
     'font_zh_path': 'wqy-microhei.ttc',
@@ -40,12 +37,33 @@ DEFAULT_CONFIG = {
     'cpu_temp_path': '/sys/class/thermal/thermal_zone0/temp',
     'cpu_freq_path': '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq',
     'reset_interval': 3600,
+    'ip_cache_ttl': 30,       # IP地址缓存时间(秒)
+    'cpu_affinity': 0,        # 绑定运行的CPU编号, -1:不绑定
+    'sched_idle': 0,          # 0:普通调度, 1:SCHED_IDLE调度
     'horizontal_mirror': 0,   # 0:不翻转, 1:水平翻转
     'vertical_mirror': 1,     # 0:不翻转, 1:垂直翻转
     'x_offset': 0,            # X方向偏移量
     'y_offset': 0             # Y方向偏移量
 }
 
+# ===== 屏幕布局 =====
+SCREEN_WIDTH = 128
+SCREEN_HEIGHT = 64
+
+# 各字段左上角坐标（未加X偏移），同一行的字段按X坐标划分区域
+FIELD_POSITIONS = {
+    'net': (0, 16),   # 第1行: IP地址
+    'temp': (0, 26),  # 第2行: CPU温度
+    'freq': (72, 26), # 第2行: CPU频率
+    'time': (0, 36),  # 第3行: 当前时间
+}
+
+# 用于计算字段区域高度的样本字符
+LAYOUT_SAMPLE = string.ascii_letters + string.digits + '.:-°'
+
+# 静态文字预渲染位图的缓存上限（日期每天变化，超出时整体清空）
+STATIC_CACHE_SIZE = 16
+
 # ===== SOC特定配置 =====
 def detect_soc_temp_path():
     """自动检测SOC的温度传感器路径"""
@@ -61,135 +79,142 @@ def detect_soc_temp_path():
     return None
 
 # ===== 配置管理 =====
+def parse_int(value):
+    """解析十进制或十六进制(0x前缀)整数"""
+    return int(value, 0)
+
+# 配置文件中各配置项所在的节及类型
+CONFIG_SCHEMA = {
+    'i2c_port': ('MONITOR', int),
+    'i2c_address': ('MONITOR', parse_int),
+    'refresh_interval': ('MONITOR', int),
+    'sample_interval': ('MONITOR', float),
+    'reset_interval': ('MONITOR', int),
+    'ip_cache_ttl': ('MONITOR', int),
+    'cpu_affinity': ('MONITOR', int),
+    'sched_idle': ('MONITOR', int),
+    'network_interface': ('MONITOR', str),
+    'font_path': ('MONITOR', str),
+    'font_zh_path': ('MONITOR', str),
+    'font_size': ('MONITOR', int),
+    'cpu_temp_path': ('SOC', str),
+    'cpu_freq_path': ('SOC', str),
+    'horizontal_mirror': ('DISPLAY', int),
+    'vertical_mirror': ('DISPLAY', int),
+    'x_offset': ('DISPLAY', int),
+    'y_offset': ('DISPLAY', int),
+}
+
+def parse_ini(lines):
+    """解析简单的INI格式（[节]、键 = 值、#/;注释），返回 {节: {键: 值}}"""
+    sections = {}
+    current = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[' and line[-1] == ']':
+            current = sections.setdefault(line[1:-1].strip(), {})
+            continue
+        # 与configparser一致：以第一个 = 或 : 分隔，键名不区分大小写
+        sep = min((i for i in (line.find('='), line.find(':')) if i > 0), default=-1)
+        if current is None or sep < 0:
+            logger.warning(f"忽略无法解析的配置行: {line}")
+            continue
+        current[line[:sep].strip().lower()] = line[sep + 1:].strip()
+    return sections
+
+def read_config_file(path):
+    """读取配置文件，返回按CONFIG_SCHEMA转换类型后的扁平字典"""
+    # 加载配置文件（如果存在）
+    try:
+        with open(path, encoding='utf-8') as f:
+            config = parse_ini(f)
+        logger.info(f"从 {path} 加载配置文件")
+    except FileNotFoundError:
+        logger.warning(f"配置文件 {path} 不存在，使用默认配置")
+        config = {}
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error(f"读取配置文件 {path} 失败: {e}，使用默认配置")
+        config = {}
+    
+    values = {}
+    for key, (section, convert) in CONFIG_SCHEMA.items():
+        raw = config.get(section, {}).get(key)
+        if raw is None:
+            continue
+        try:
+            values[key] = convert(raw)
+        except ValueError:
+            logger.error(f"无效的配置值 {key} = {raw}，使用默认值 {DEFAULT_CONFIG[key]}")
+    return values
+
 def load_config():
     """加载配置（命令行参数 > 配置文件 > 默认值）"""
     parser = argparse.ArgumentParser(description='OLED系统监控显示器')
     
     # 添加命令行参数
     parser.add_argument('--config', type=str, default='/etc/oled_monitor.conf', 
-                        help='配置文件路径 (默认: /etc/oled_monitor.conf)')
-    parser.add_argument('--i2c-port', type=int, 
-                        help=f'I2C端口 (默认: {DEFAULT_CONFIG["i2c_port"]})')
-    parser.add_argument('--i2c-address', type=lambda x: int(x, 0), 
-                        help=f'I2C地址 (十六进制，默认: 0x{DEFAULT_CONFIG["i2c_address"]:02X})')
-    parser.add_argument('--refresh', type=int, 
-                        help=f'刷新间隔(秒) (默认: {DEFAULT_CONFIG["refresh_interval"]})')
-    parser.add_argument('--interface', type=str, 
-                        help=f'网络接口 (默认: {DEFAULT_CONFIG["network_interface"]})')
-    parser.add_argument('--font', type=str, 
-                        help=f'字体文件路径 (默认: {DEFAULT_CONFIG["font_path"]})')
-    parser.add_argument('--font_zh', type=str, 
-                        help=f'中文字体文件路径 (默认: {DEFAULT_CONFIG["font_zh_path"]})')
-    parser.add_argument('--font-size', type=int, 
-                        help=f'字体大小 (默认: {DEFAULT_CONFIG["font_size"]})')
-    parser.add_argument('--reset-interval', type=int, 
-                        help=f'设备重置间隔(秒) (默认: {DEFAULT_CONFIG["reset_interval"]})')
+                        help='配置文件路径 (默认: %(default)s)')
+    parser.add_argument('--i2c-port', dest='i2c_port', type=int, 
+                        default=DEFAULT_CONFIG['i2c_port'],
+                        help='I2C端口 (默认: %(default)s)')
+    parser.add_argument('--i2c-address', dest='i2c_address', type=parse_int, 
+                        default=DEFAULT_CONFIG['i2c_address'],
+                        help='I2C地址 (十六进制，默认: 0x%(default)02X)')
+    parser.add_argument('--refresh', dest='refresh_interval', metavar='REFRESH', type=int, 
+                        default=DEFAULT_CONFIG['refresh_interval'],
+                        help='刷新间隔(秒) (默认: %(default)s)')
+    parser.add_argument('--sample-interval', dest='sample_interval', type=float, 
+                        default=DEFAULT_CONFIG['sample_interval'],
+                        help='CPU温度/频率采样间隔(秒) (默认: %(default)s)')
+    parser.add_argument('--interface', dest='network_interface', metavar='INTERFACE', type=str, 
+                        default=DEFAULT_CONFIG['network_interface'],
+                        help='网络接口 (默认: %(default)s)')
+    parser.add_argument('--font', dest='font_path', metavar='FONT', type=str, 
+                        default=DEFAULT_CONFIG['font_path'],
+                        help='字体文件路径 (默认: %(default)s)')
+    parser.add_argument('--font_zh', dest='font_zh_path', metavar='FONT_ZH', type=str, 
+                        default=DEFAULT_CONFIG['font_zh_path'],
+                        help='中文字体文件路径 (默认: %(default)s)')
+    parser.add_argument('--font-size', dest='font_size', type=int, 
+                        default=DEFAULT_CONFIG['font_size'],
+                        help='字体大小 (默认: %(default)s)')
+    parser.add_argument('--reset-interval', dest='reset_interval', type=int, 
+                        default=DEFAULT_CONFIG['reset_interval'],
+                        help='设备重置间隔(秒) (默认: %(default)s)')
+    parser.add_argument('--ip-cache-ttl', dest='ip_cache_ttl', type=int, 
+                        default=DEFAULT_CONFIG['ip_cache_ttl'],
+                        help='IP地址缓存时间(秒) (默认: %(default)s)')
+    parser.add_argument('--cpu-affinity', dest='cpu_affinity', type=int, 
+                        default=DEFAULT_CONFIG['cpu_affinity'],
+                        help='绑定运行的CPU编号, -1为不绑定 (默认: %(default)s)')
+    parser.add_argument('--sched-idle', dest='sched_idle', type=int, choices=[0, 1],
+                        default=DEFAULT_CONFIG['sched_idle'],
+                        help='使用SCHED_IDLE调度 (0:否, 1:是, 默认: %(default)s)')
     
     # 新增显示配置参数
-    parser.add_argument('--horizontal-mirror', type=int, choices=[0, 1],
-                        help=f'水平翻转 (0:不翻转, 1:翻转, 默认: {DEFAULT_CONFIG["horizontal_mirror"]})')
-    parser.add_argument('--vertical-mirror', type=int, choices=[0, 1],
-                        help=f'垂直翻转 (0:不翻转, 1:翻转, 默认: {DEFAULT_CONFIG["vertical_mirror"]})')
-    parser.add_argument('--x-offset', type=int, 
-                        help=f'X方向偏移量 (默认: {DEFAULT_CONFIG["x_offset"]})')
-    parser.add_argument('--y-offset', type=int, 
-                        help=f'Y方向偏移量 (默认: {DEFAULT_CONFIG["y_offset"]})')
-    
-    # 解析命令行参数
-    args = parser.parse_args()
-    
-    # 创建配置对象
-    config = configparser.ConfigParser()
-    config['DEFAULT'] = DEFAULT_CONFIG
-    
-    # 加载配置文件（如果存在）
-    if os.path.exists(args.config):
-        config.read(args.config)
-        logger.info(f"从 {args.config} 加载配置文件")
-    else:
-        logger.warning(f"配置文件 {args.config} 不存在，使用默认配置")
-    
-    # 创建应用配置
-    app_config = {}
-    
-    # 合并配置（命令行 > 配置文件 > 默认值）
-    app_config['i2c_port'] = (
-        args.i2c_port or
-        config.getint('MONITOR', 'i2c_port', fallback=DEFAULT_CONFIG['i2c_port'])
-    )
-    
-    # 获取原始字符串值（可能是十六进制或十进制字符串）
-    i2c_address_str = config.get('MONITOR', 'i2c_address', fallback=str(DEFAULT_CONFIG['i2c_address']))
-    
-    # 转换十六进制或十进制字符串为整数
-    try:
-        if i2c_address_str.lower().startswith('0x'):
-            i2c_address_val = int(i2c_address_str, 16)
-        else:
-            i2c_address_val = int(i2c_address_str)
-    except ValueError:
-        logger.error(f"无效的 I2C 地址格式: {i2c_address_str}，使用默认值 0x3C")
-        i2c_address_val = 0x3C
-    
-    app_config['i2c_address'] = args.i2c_address or i2c_address_val
-
-    app_config['refresh_interval'] = (
-        args.refresh or
-        config.getint('MONITOR', 'refresh_interval', fallback=DEFAULT_CONFIG['refresh_interval'])
-    )
-    
-    app_config['network_interface'] = (
-        args.interface or
-        config.get('MONITOR', 'network_interface', fallback=DEFAULT_CONFIG['network_interface'])
-    )
-    
-    app_config['font_path'] = (
-        args.font or
-        config.get('MONITOR', 'font_path', fallback=DEFAULT_CONFIG['font_path'])
-    )
-    
-    app_config['font_zh_path'] = (
-        args.font_zh or
-        config.get('MONITOR', 'font_zh_path', fallback=DEFAULT_CONFIG['font_zh_path'])
-    )
-    
-    app_config['font_size'] = (
-        args.font_size or
-        config.getint('MONITOR', 'font_size', fallback=DEFAULT_CONFIG['font_size'])
-    )
-    
-    app_config['reset_interval'] = (
-        args.reset_interval or
-        config.getint('MONITOR', 'reset_interval', fallback=DEFAULT_CONFIG['reset_interval'])
-    )
-    
-    # 新增显示配置
-    app_config['horizontal_mirror'] = (
-        args.horizontal_mirror if args.horizontal_mirror is not None else
-        config.getint('DISPLAY', 'horizontal_mirror', fallback=DEFAULT_CONFIG['horizontal_mirror'])
-    )
-    
-    app_config['vertical_mirror'] = (
-        args.vertical_mirror if args.vertical_mirror is not None else
-        config.getint('DISPLAY', 'vertical_mirror', fallback=DEFAULT_CONFIG['vertical_mirror'])
-    )
-    
-    app_config['x_offset'] = (
-        args.x_offset if args.x_offset is not None else
-        config.getint('DISPLAY', 'x_offset', fallback=DEFAULT_CONFIG['x_offset'])
-    )
-    
-    app_config['y_offset'] = (
-        args.y_offset if args.y_offset is not None else
-        config.getint('DISPLAY', 'y_offset', fallback=DEFAULT_CONFIG['y_offset'])
-    )
-    
-    # SOC特定配置
-    app_config['cpu_temp_path'] = detect_soc_temp_path() or config.get(
-        'SOC', 'cpu_temp_path', fallback=DEFAULT_CONFIG['cpu_temp_path'])
-    
-    app_config['cpu_freq_path'] = config.get(
-        'SOC', 'cpu_freq_path', fallback=DEFAULT_CONFIG['cpu_freq_path'])
+    parser.add_argument('--horizontal-mirror', dest='horizontal_mirror', type=int, choices=[0, 1],
+                        default=DEFAULT_CONFIG['horizontal_mirror'],
+                        help='水平翻转 (0:不翻转, 1:翻转, 默认: %(default)s)')
+    parser.add_argument('--vertical-mirror', dest='vertical_mirror', type=int, choices=[0, 1],
+                        default=DEFAULT_CONFIG['vertical_mirror'],
+                        help='垂直翻转 (0:不翻转, 1:翻转, 默认: %(default)s)')
+    parser.add_argument('--x-offset', dest='x_offset', type=int, 
+                        default=DEFAULT_CONFIG['x_offset'],
+                        help='X方向偏移量 (默认: %(default)s)')
+    parser.add_argument('--y-offset', dest='y_offset', type=int, 
+                        default=DEFAULT_CONFIG['y_offset'],
+                        help='Y方向偏移量 (默认: %(default)s)')
+    
+    # 先取得配置文件路径，再把 默认值 < 配置文件 作为参数默认值，由命令行覆盖
+    args, _ = parser.parse_known_args()
+    parser.set_defaults(**{**DEFAULT_CONFIG, **read_config_file(args.config)})
+    app_config = vars(parser.parse_args())
+    del app_config['config']
+    
+    # SOC特定配置：自动检测到的温度传感器路径优先
+    app_config['cpu_temp_path'] = detect_soc_temp_path() or app_config['cpu_temp_path']
     
     return app_config
 
@@ -198,17 +223,53 @@ class OLEDManager:
     """OLED显示设备管理器"""
     
     def __init__(self, config):
+        from PIL import Image, ImageDraw
+        
         self.config = config
         self.device = None
-        self.last_reset_time = time.time()
-        self.init_display()
+        # 定期重置由SIGALRM定时器触发，刷新时只需检查该标志
+        self._reset_pending = False
+        
+        # 常驻帧缓冲（整个运行期间只分配一次）及各字段的渲染状态
+        self._fb = Image.new('1', (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._draw = ImageDraw.Draw(self._fb)
+        self._font = None
+        self._slots = {}
+        self._rendered = {}
+        self._drawn_boxes = {}
+        self._last_fields = None
+        self._static_cache = {}
+        self._atlas = {}
+        # 中文字体按需加载（None:未加载）
+        self._font_zh = None
+        
+        # 打开sysfs文件并保持句柄，每次刷新只需seek+read
+        self._temp_fd = open_sysfs(config['cpu_temp_path'])
+        self._freq_fd = open_sysfs(config['cpu_freq_path'])
+        # 最近一次采样 (时间戳, 温度, 频率)
+        self._cpu_sample = None
+        
+        # 预先生成地址字符串及初始化日志（每次定期重置都会用到）
+        self._addr_str = f"0x{config['i2c_address']:02X}"
+        self._init_banner = (
+            f"OLED显示器初始化成功 (I2C-{config['i2c_port']} @ {self._addr_str})",
+            f"显示设置: 水平镜像={config['horizontal_mirror']}, 垂直镜像={config['vertical_mirror']}, "
+            f"X偏移={config['x_offset']}, Y偏移={config['y_offset']}",
+        )
         
         # 注册信号处理器
+        signal.signal(signal.SIGALRM, self._reset_on_alarm)
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
+        
+        self.check_bus_speed()
+        self.init_display()
     
     def init_display(self):
         """初始化或重新初始化OLED显示设备"""
+        from luma.core.interface.serial import i2c
+        from luma.oled.device import ssd1306
+        
         try:
             if self.device:
                 # 尝试清理现有设备
@@ -226,22 +287,45 @@ class OLEDManager:
             hor_cmd = 0xA1 if self.config['horizontal_mirror'] else 0xA0
             ver_cmd = 0xC8 if self.config['vertical_mirror'] else 0xC0
             
-            self.device.command(hor_cmd)  # 水平镜像
-            self.device.command(ver_cmd)  # 垂直镜像
+            # 镜像及边缘偏移命令合并为一次I2C写入
+            self.device.command(
+                hor_cmd,                  # 水平镜像
+                ver_cmd,                  # 垂直镜像
+                0xD3,                     # 设置显示偏移
+                self.config['y_offset'],  # Y偏移值 (使用配置值)
+            )
             
-            # 应用边缘偏移 (使用配置值)
-            self.device.command(0xD3)  # 设置显示偏移
-            self.device.command(self.config['y_offset'])  # Y偏移值
+            # 设备初始化时已清屏，帧缓冲原地清空并强制重绘所有字段
+            self._draw.rectangle((0, 0, SCREEN_WIDTH - 1, SCREEN_HEIGHT - 1), fill=0)
+            self._rendered = {}
+            self._drawn_boxes = {}
+            self._last_fields = None
             
-            self.last_reset_time = time.time()
-            logger.info(f"OLED显示器初始化成功 (I2C-{self.config['i2c_port']} @ 0x{self.config['i2c_address']:02X})")
-            logger.info(f"显示设置: 水平镜像={self.config['horizontal_mirror']}, 垂直镜像={self.config['vertical_mirror']}, X偏移={self.config['x_offset']}, Y偏移={self.config['y_offset']}")
+            # 从本次初始化开始重新计时（reset_interval<=0时不定期重置）
+            self._reset_pending = False
+            signal.setitimer(signal.ITIMER_REAL, max(0, self.config['reset_interval']))
+            for line in self._init_banner:
+                logger.info(line)
             return True
         except Exception as e:
             logger.error(f"显示器初始化失败: {e}")
             self.device = None
             return False
     
+    def check_bus_speed(self):
+        """检查I2C总线时钟，低于Fast-mode(400kHz)时给出提示"""
+        # 总线时钟由设备树i2c节点的clock-frequency决定，用户态无法在运行时修改。
+        # SSD1306支持400kHz，每帧耗时约为100kHz时的1/4；但同一总线上若挂有
+        # 只支持100kHz的器件或走线较长，提速后可能出现通信错误，因此只提示不强制。
+        speed = get_i2c_bus_speed(self.config['i2c_port'])
+        if speed is None:
+            logger.info(f"无法读取I2C-{self.config['i2c_port']}总线时钟")
+        elif speed < I2C_FAST_MODE_HZ:
+            logger.warning(f"I2C-{self.config['i2c_port']}总线时钟为{speed // 1000}kHz，"
+                           f"可在设备树中将clock-frequency设为{I2C_FAST_MODE_HZ}以加快刷新")
+        else:
+            logger.info(f"I2C-{self.config['i2c_port']}总线时钟: {speed // 1000}kHz")
+    
     def clear_screen(self):
         """清除屏幕内容"""
         if self.device:
@@ -263,6 +347,8 @@ class OLEDManager:
     
     def cleanup(self):
         """清理资源"""
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        
         try:
             self.clear_screen()
         except Exception as e:
@@ -274,16 +360,207 @@ class OLEDManager:
             except Exception as e:
                 logger.error(f"清理设备时出错: {e}")
             self.device = None
+        
+        for fd in (self._temp_fd, self._freq_fd):
+            if fd:
+                fd.close()
+        self._temp_fd = self._freq_fd = None
+    
+    def _read_sysfs(self, fd, path):
+        """通过持久句柄读取sysfs数值并除以1000（出错时重新打开一次）"""
+        for _ in range(2):
+            if fd is None:
+                fd = open_sysfs(path)
+                if fd is None:
+                    return None, 0.0
+            try:
+                fd.seek(0)
+                return fd, float(fd.read()) / 1000.0
+            except (OSError, ValueError) as e:
+                logger.error(f"读取 {path} 失败: {e}")
+                fd.close()
+                fd = None
+        return None, 0.0
+    
+    def get_cpu_info(self):
+        """获取SOC的CPU温度和频率（按采样间隔缓存并平滑）"""
+        now = time.monotonic()
+        if self._cpu_sample and now - self._cpu_sample[0] < self.config['sample_interval']:
+            return self._cpu_sample[1], self._cpu_sample[2]
+        
+        # 温度转换为摄氏度
+        self._temp_fd, temp = self._read_sysfs(self._temp_fd, self.config['cpu_temp_path'])
+        # 频率转换为MHz
+        self._freq_fd, freq = self._read_sysfs(self._freq_fd, self.config['cpu_freq_path'])
+        
+        if self._cpu_sample:
+            temp = smooth(self._cpu_sample[1], temp)
+            freq = smooth(self._cpu_sample[2], freq)
+        self._cpu_sample = (now, temp, freq)
+        return temp, freq
+    
+    def _reset_on_alarm(self, signum, frame):
+        """重置定时器到期，标记需要重置设备"""
+        self._reset_pending = True
     
     def check_and_reset(self):
         """检查是否需要重置设备"""
-        current_time = time.time()
-        if current_time - self.last_reset_time > self.config['reset_interval']:
+        if self._reset_pending:
             logger.info("定期重置显示设备...")
             return self.init_display()
         return True
     
-    def display_info(self, font, font_zh):
+    def _prepare_layout(self, font):
+        """根据字体计算各字段的固定显示区域"""
+        x_offset = self.config['x_offset']
+        self._font = font
+        self._slots = {}
+        for name, (x, y) in FIELD_POSITIONS.items():
+            # 右边界为同一行下一个字段的起点，否则为屏幕右边缘
+            right = min([fx for fx, fy in FIELD_POSITIONS.values() if fy == y and fx > x],
+                        default=SCREEN_WIDTH - x_offset)
+            _, top, _, bottom = self._draw.textbbox((0, y), LAYOUT_SAMPLE, font=font)
+            self._slots[name] = clip_box((x + x_offset, top, right + x_offset, bottom))
+        self._rendered = {}
+        self._static_cache = {}
+        self._atlas = self._build_atlas(font)
+    
+    def _build_atlas(self, font):
+        """把ASCII可打印字符预渲染到1位字形图集，返回 {字符: (字形, 左偏移, 上偏移, 步进)}"""
+        from PIL import Image, ImageDraw
+        
+        # 逐字符拼接无法还原字距调整，只对等宽字体（如默认的NotoMono）启用图集
+        advances = {self._draw.textlength(chr(code), font=font) for code in range(0x20, 0x7F)}
+        if len(advances) > 1:
+            logger.info("字体非等宽，不使用字形图集")
+            return {}
+        advance = advances.pop()
+        
+        metrics = []
+        width = height = 0
+        for code in range(0x20, 0x7F):
+            ch = chr(code)
+            left, top, right, bottom = self._draw.textbbox((0, 0), ch, font=font)
+            metrics.append((ch, width, left, top, right - left, bottom - top))
+            width += right - left
+            height = max(height, bottom - top)
+        
+        atlas = Image.new('1', (max(1, width), max(1, height)))
+        draw = ImageDraw.Draw(atlas)
+        glyphs = {}
+        for ch, gx, left, top, w, h in metrics:
+            draw.text((gx - left, -top), ch, font=font, fill="white")
+            # 每个字形只裁剪一次，绘制时直接作为蒙版粘贴（空格等无像素字符只记录步进）
+            glyph = atlas.crop((gx, 0, gx + w, h)) if w > 0 and h > 0 else None
+            glyphs[ch] = (glyph, left, top, advance)
+        return glyphs
+    
+    def _paste_glyphs(self, pos, text):
+        """用字形图集逐字符粘贴文字（不经过FreeType），返回绘制区域"""
+        x, y = pos
+        drawn = None
+        for ch in text:
+            glyph, left, top, advance = self._atlas[ch]
+            if glyph is not None:
+                origin = (round(x + left), y + top)
+                self._fb.paste(1, origin, glyph)
+                drawn = union_box(drawn, (origin[0], origin[1],
+                                          origin[0] + glyph.width, origin[1] + glyph.height))
+            x += advance
+        return drawn
+    
+    def _font_for(self, text, font):
+        """选择绘制文字所用字体：含主字体不支持的字符时按需加载中文字体"""
+        if not needs_zh_font(text):
+            return font
+        if self._font_zh is None:
+            from PIL import ImageFont
+            try:
+                self._font_zh = ImageFont.truetype(self.config['font_zh_path'], self.config['font_size'])
+                logger.info("中文字体加载成功")
+            except IOError as e:
+                logger.warning(f"无法加载中文字体: {e}，使用主字体")
+                self._font_zh = font
+        return self._font_zh
+    
+    def _static_bitmap(self, text, font):
+        """获取静态文字的预渲染位图 (位图, 左偏移, 上偏移)"""
+        bitmap = self._static_cache.get(text)
+        if bitmap is None:
+            from PIL import Image, ImageDraw
+            if len(self._static_cache) >= STATIC_CACHE_SIZE:
+                self._static_cache.clear()
+            left, top, right, bottom = self._draw.textbbox((0, 0), text, font=font)
+            image = Image.new('1', (max(1, right - left), max(1, bottom - top)))
+            ImageDraw.Draw(image).text((-left, -top), text, font=font, fill="white")
+            bitmap = self._static_cache[text] = (image, left, top)
+        return bitmap
+    
+    def _draw_segments(self, pos, segments, font):
+        """绘制由(文字, 是否静态)片段组成的字段，返回绘制区域"""
+        x, y = pos
+        drawn = None
+        for text, static in segments:
+            font_used = self._font_for(text, font)
+            if static:
+                # 静态片段直接以位图为蒙版粘贴，无需FreeType重新光栅化
+                image, left, top = self._static_bitmap(text, font_used)
+                origin = (round(x + left), y + top)
+                self._fb.paste(1, origin, image)
+                box = (origin[0], origin[1], origin[0] + image.width, origin[1] + image.height)
+            elif font_used is font and all(ch in self._atlas for ch in text):
+                # 动态片段（数字、IP等）由字形图集拼接
+                box = self._paste_glyphs((x, y), text)
+            else:
+                self._draw.text((x, y), text, font=font_used, fill="white")
+                box = self._draw.textbbox((x, y), text, font=font_used)
+            drawn = union_box(drawn, box)
+            x += self._draw.textlength(text, font=font_used)
+        return clip_box(drawn) if drawn else None
+    
+    def _render(self, fields, font):
+        """只重绘内容有变化的字段（字段值为片段元组），返回需要刷新的区域（无变化返回None）"""
+        if font is not self._font:
+            self._prepare_layout(font)
+        
+        changed = [name for name, text in fields.items() if self._rendered.get(name) != text]
+        if not changed:
+            return None
+        
+        # 清除变化字段的区域（包括上次文字超出区域的部分）
+        cleared = []
+        for name in changed:
+            box = union_box(self._slots[name], self._drawn_boxes.get(name))
+            self._draw.rectangle((box[0], box[1], box[2] - 1, box[3] - 1), fill=0)
+            cleared.append(box)
+        
+        # 重绘变化字段，以及与清除区域重叠的其它字段
+        dirty = None
+        for name, segments in fields.items():
+            area = union_box(self._slots[name], self._drawn_boxes.get(name))
+            if name not in changed and not any(intersects(area, box) for box in cleared):
+                continue
+            x, y = FIELD_POSITIONS[name]
+            pos = (x + self.config['x_offset'], y)
+            self._drawn_boxes[name] = self._draw_segments(pos, segments, font)
+            self._rendered[name] = segments
+            dirty = union_box(dirty, self._drawn_boxes[name])
+        
+        for box in cleared:
+            dirty = union_box(dirty, box)
+        return dirty
+    
+    def _flush(self, box):
+        """只把box覆盖的列/页写入SSD1306显存"""
+        left, top, right, bottom = box
+        if left >= right or top >= bottom:
+            return
+        page_start, page_end = top // 8, (bottom - 1) // 8
+        # 设置列地址(0x21)和页地址(0x22)窗口，随后的数据只写入该窗口
+        self.device.command(0x21, left, right - 1, 0x22, page_start, page_end)
+        self.device.data(list(pack_pages(self._fb, left, right, page_start, page_end)))
+    
+    def display_info(self, font):
         """在OLED上显示三行信息（带异常处理）"""
         if not self.device or not self.check_and_reset():
             logger.error("显示设备不可用，尝试重新初始化...")
@@ -291,25 +568,32 @@ class OLEDManager:
                 return False
         
         try:
-            with canvas(self.device) as draw:
-                x_offset = self.config['x_offset']
-
+            interface = self.config['network_interface']
+            cpu_temp, cpu_freq = self.get_cpu_info()
+            date_str, clock_str = get_current_time().split(' ')
+            # 每个字段由(文字, 是否静态)片段组成，静态片段使用预渲染位图
+            fields = {
                 # 第1行: IP地址
-                ip_address = get_ip_address(self.config['network_interface'])
-                net_info = f"{self.config['network_interface']}:{ip_address}"
-                draw.text((0 + x_offset, 16), net_info, font=font, fill="white")
-                
+                'net': ((f"{interface}:", True),
+                        (get_ip_address(interface, self.config['ip_cache_ttl']), False)),
                 # 第2行: CPU温度及频率
-                cpu_temp, cpu_freq = get_cpu_info(self.config)
-                cpu_info = f"soc:{cpu_temp:.1f}°C"
-                draw.text((0 + x_offset, 26), cpu_info, font=font, fill="white")
-                cpu_info = f"{cpu_freq:.0f}MHz"
-                draw.text((72 + x_offset, 26), cpu_info, font=font, fill="white")
-
-                # 第3行: 当前时间
-                time_str = get_current_time()
-                draw.text((0 + x_offset, 36), time_str, font=font, fill="white")
-                
+                'temp': (("soc:", True), (f"{cpu_temp:.1f}", False), ("°C", True)),
+                'freq': ((f"{cpu_freq:.0f}", False), ("MHz", True)),
+                # 第3行: 当前时间（日期每天才变化一次）
+                'time': ((f"{date_str} ", True), (clock_str, False)),
+            }
+            
+            # 所有字段均无变化时跳过绘制和I2C传输
+            snapshot = tuple(fields.values())
+            if snapshot == self._last_fields:
+                return True
+            
+            # 只推送发生变化的区域
+            dirty = self._render(fields, font)
+            if dirty:
+                self._flush(dirty)
+            self._last_fields = snapshot
+            
             return True
         except Exception as e:
             logger.error(f"显示信息失败: {e}")
@@ -317,58 +601,150 @@ class OLEDManager:
             self.init_display()
             return False
 
+# ===== I2C总线 =====
+# I2C Fast-mode 时钟频率
+I2C_FAST_MODE_HZ = 400000
+
+def get_i2c_bus_speed(port):
+    """从设备树读取I2C总线时钟频率(Hz)，无法读取时返回None"""
+    path = f'/sys/class/i2c-adapter/i2c-{port}/of_node/clock-frequency'
+    try:
+        with open(path, 'rb') as f:
+            # 设备树属性为大端32位整数
+            return struct.unpack('>I', f.read(4))[0]
+    except (OSError, struct.error):
+        return None
+
+# ===== 帧缓冲辅助函数 =====
+def needs_zh_font(text):
+    """判断文字是否含有超出Latin-1范围的字符（如中文）"""
+    return any(ord(c) > 0xFF for c in text)
+
+def clip_box(box):
+    """把区域(left, top, right, bottom)限制在屏幕范围内"""
+    left, top, right, bottom = box
+    return (max(0, min(left, SCREEN_WIDTH)), max(0, min(top, SCREEN_HEIGHT)),
+            max(0, min(right, SCREEN_WIDTH)), max(0, min(bottom, SCREEN_HEIGHT)))
+
+def union_box(a, b):
+    """合并两个区域（任一为None时返回另一个）"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+def intersects(a, b):
+    """判断两个区域是否重叠"""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+def pack_pages(image, left, right, page_start, page_end):
+    """按SSD1306显存格式打包指定列/页（每字节为一列8个像素，低位在上）"""
+    from PIL import Image
+    # 整个区域旋转270度后，每行对应一列，该列各页字节按从下到上的顺序排列
+    pages = page_end - page_start + 1
+    raw = image.crop((left, page_start * 8, right, (page_end + 1) * 8)).transpose(Image.ROTATE_270).tobytes()
+    return b''.join(raw[pages - 1 - page::pages] for page in range(pages))
+
 # ===== 数据获取函数 =====
 def get_current_time():
     """获取当前时间（精简格式）"""
-    now = datetime.datetime.now()
-    return now.strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+# SIOCGIFADDR: 直接查询单个接口的IPv4地址
+SIOCGIFADDR = 0x8915
 
-def get_ip_address(interface):
-    """获取指定网络接口的IP地址"""
+# IP地址缓存 (时间戳, 接口, IP)
+_ip_cache = (0.0, None, None)
+
+def get_ip_address(interface, cache_ttl=DEFAULT_CONFIG['ip_cache_ttl']):
+    """获取指定网络接口的IP地址（带缓存）"""
+    global _ip_cache
+    timestamp, cached_interface, cached_ip = _ip_cache
+    now = time.monotonic()
+    if cached_interface == interface and now - timestamp <= cache_ttl:
+        return cached_ip
+    
     try:
-        # 获取网络接口信息
-        addrs = psutil.net_if_addrs().get(interface, [])
-        
-        # 查找第一个IPv4地址
-        for addr in addrs:
-            if addr.family == socket.AF_INET:
-                # 返回带前缀的完整IP地址
-                return f"{addr.address}"
-        
-        return "ip:N/A"
+        # 单次ioctl查询，无需遍历所有接口及地址族
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR,
+                                struct.pack('256s', interface[:15].encode()))
+        ip = socket.inet_ntoa(ifreq[20:24])
+    except OSError:
+        # 接口不存在或尚未分配IPv4地址
+        ip = "ip:N/A"
     except Exception as e:
         logger.error(f"获取IP地址失败: {e}")
-        return "ip:N/A"
+        ip = "ip:N/A"
+    
+    _ip_cache = (now, interface, ip)
+    return ip
 
-def get_cpu_info(config):
-    """获取SOC的CPU温度和频率"""
+def list_interfaces():
+    """列出所有网络接口名称（仅读取/sys/class/net目录）"""
     try:
-        # 获取CPU温度
-        temp = 0.0
-        if os.path.exists(config['cpu_temp_path']):
-            with open(config['cpu_temp_path'], 'r') as f:
-                temp = float(f.read().strip()) / 1000.0  # 转换为摄氏度
-        else:
-            logger.warning(f"温度传感器路径不存在: {config['cpu_temp_path']}")
-        
-        # 获取CPU频率
-        freq = 0.0
-        if os.path.exists(config['cpu_freq_path']):
-            with open(config['cpu_freq_path'], 'r') as f:
-                freq = float(f.read().strip()) / 1000.0  # 转换为MHz
-        else:
-            logger.warning(f"CPU频率路径不存在: {config['cpu_freq_path']}")
-        
-        return temp, freq
-    except Exception as e:
-        logger.error(f"获取CPU信息失败: {e}")
-        return 0.0, 0.0
+        return sorted(os.listdir('/sys/class/net'))
+    except OSError as e:
+        logger.error(f"获取网络接口列表失败: {e}")
+        return []
+
+# 平滑系数：新采样值所占权重
+SMOOTHING_ALPHA = 0.3
+
+def smooth(prev, raw, alpha=SMOOTHING_ALPHA):
+    """指数加权移动平均（任一值为0即读取失败时不做平滑）"""
+    if not prev or not raw:
+        return raw
+    return alpha * raw + (1 - alpha) * prev
+
+def open_sysfs(path):
+    """打开sysfs文件并返回持久句柄（失败返回None）"""
+    try:
+        return open(path, 'r')
+    except OSError as e:
+        logger.warning(f"sysfs路径无法打开: {path} ({e})")
+        return None
+
+# ===== 进程调度 =====
+def set_process_scheduling(config):
+    """降低进程优先级，并按配置绑定CPU及使用SCHED_IDLE调度"""
+    try:
+        os.nice(10)  # 降低进程优先级
+    except OSError:
+        pass
+    
+    # 固定在单个CPU上运行，避免周期性唤醒时在各核之间迁移
+    # （默认CPU0，网卡中断由/etc/balance_irq分配到其它核）
+    if config['cpu_affinity'] >= 0:
+        try:
+            os.sched_setaffinity(0, {config['cpu_affinity']})
+            logger.info(f"进程已绑定到CPU{config['cpu_affinity']}")
+        except OSError as e:
+            logger.warning(f"绑定CPU{config['cpu_affinity']}失败: {e}")
+    
+    # SCHED_IDLE只在CPU空闲时运行，不会抢占其它任务；但系统满载时刷新可能停顿
+    if config['sched_idle']:
+        try:
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+            logger.info("已切换为SCHED_IDLE调度")
+        except OSError as e:
+            logger.warning(f"切换SCHED_IDLE调度失败: {e}")
 
 # ===== 主程序 =====
 def main():
     # 加载配置
     config = load_config()
     
+    # 检查依赖库是否安装
+    try:
+        import luma.oled.device
+        from PIL import ImageFont
+    except ImportError as e:
+        logger.error(f"缺少依赖库: {e.name}")
+        logger.error("请运行: sudo apt-get install python3-luma.oled")
+        exit(1)
+    
     logger.info("=== OLED监控器配置 ===")
     logger.info(f"I2C端口: {config['i2c_port']}")
     logger.info(f"I2C地址: 0x{config['i2c_address']:02X}")
@@ -376,20 +752,25 @@ def main():
     logger.info(f"设备重置间隔: {config['reset_interval']}秒")
     logger.info(f"网络接口: {config['network_interface']}")
     logger.info(f"字体: {config['font_path']} (大小: {config['font_size']}px)")
-    logger.info(f"字体(中文): {config['font_zh_path']} (大小: {config['font_size']}px)")
+    logger.info(f"字体(中文): {config['font_zh_path']} (大小: {config['font_size']}px, 按需加载)")
     logger.info(f"CPU温度路径: {config['cpu_temp_path']}")
     logger.info(f"CPU频率路径: {config['cpu_freq_path']}")
     logger.info(f"水平镜像: {config['horizontal_mirror']}")
     logger.info(f"垂直镜像: {config['vertical_mirror']}")
     logger.info(f"X偏移: {config['x_offset']}")
     logger.info(f"Y偏移: {config['y_offset']}")
+    logger.info(f"CPU绑定: {config['cpu_affinity']}")
+    logger.info(f"SCHED_IDLE调度: {config['sched_idle']}")
+    
+    # 调整进程调度
+    set_process_scheduling(config)
     
     # 检查网络接口是否存在
-    if config['network_interface'] not in psutil.net_if_addrs():
+    interfaces = list_interfaces()
+    if config['network_interface'] not in interfaces:
         logger.warning(f"网络接口 '{config['network_interface']}' 不存在")
-        logger.info("可用接口: %s", list(psutil.net_if_addrs().keys()))
+        logger.info("可用接口: %s", interfaces)
         # 尝试使用第一个可用接口
-        interfaces = list(psutil.net_if_addrs().keys())
         if interfaces:
             config['network_interface'] = interfaces[0]
             logger.info(f"使用接口: {config['network_interface']}")
@@ -403,12 +784,10 @@ def main():
     # 加载字体
     try:
         font = ImageFont.truetype(config['font_path'], config['font_size'])
-        font_zh = ImageFont.truetype(config['font_zh_path'], config['font_size'])
         logger.info("字体加载成功")
     except IOError as e:
         logger.warning(f"无法加载指定字体: {e}，使用默认字体")
         font = ImageFont.load_default()
-        font_zh = ImageFont.load_default()
     
     logger.info("开始监控系统...")
     logger.info("按Ctrl+C退出程序...")
@@ -418,11 +797,11 @@ def main():
     max_watchdog_errors = 10
     
     try:
+        # 使用单调时钟按固定节拍调度，不受NTP校时影响，也不会累积漂移
+        next_tick = time.clock_gettime(time.CLOCK_MONOTONIC)
         while True:
-            start_time = time.time()
-            
             # 显示信息
-            if not oled_manager.display_info(font, font_zh):
+            if not oled_manager.display_info(font):
                 watchdog_counter += 1
                 logger.error(f"显示失败 ({watchdog_counter}/{max_watchdog_errors})")
                 
@@ -433,10 +812,14 @@ def main():
             else:
                 watchdog_counter = 0  # 重置计数器
             
-            # 计算实际睡眠时间（保持精确的刷新间隔）
-            elapsed = time.time() - start_time
-            sleep_time = max(0, config['refresh_interval'] - elapsed)
-            time.sleep(sleep_time)
+            # 睡眠到下一个节拍（保持精确的刷新间隔）
+            next_tick += config['refresh_interval']
+            sleep_time = next_tick - time.clock_gettime(time.CLOCK_MONOTONIC)
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            else:
+                # 已落后于计划（如设备重置耗时过长），从当前时间重新对齐，避免连续补帧
+                next_tick = time.clock_gettime(time.CLOCK_MONOTONIC)
             
     except (KeyboardInterrupt, SystemExit):
         logger.info("程序被用户中断")
@@ -453,18 +836,4 @@ def main():
         logger.info("资源已清理，程序退出")
 
 if __name__ == "__main__":
-    # 检查psutil是否安装
-    try:
-        import psutil
-    except ImportError:
-        print("错误: 需要安装psutil库")
-        print("请运行: sudo pip3 install psutil")
-        exit(1)
-    
-    # 提升进程优先级
-    try:
-        os.nice(10)  # 降低进程优先级
-    except:
-        pass
-    
     main()